@@ -13,10 +13,155 @@ Usage:
   a list of quiz questions.
 """
 
+import copy
+import math
+import random
 import requests
+import threading
 import time
+from requests.adapters import HTTPAdapter
+
+# Use orjson for faster JSON decoding when it is installed, otherwise fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Only advertise Brotli compression when a decoder for it is installed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Open Trivia Database API endpoint
+API_URL = "https://opentdb.com/api.php"
+
+# Connect and read timeouts (in seconds) for API requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Shared session so retries and repeated fetches reuse the same pooled connection
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "QuizMe/1.0",
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING, # Compressed responses mean less data on the wire
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+
+# Open Trivia Database response codes
+RESPONSE_CODE_SUCCESS = 0 # Results returned successfully
+RESPONSE_CODE_NO_RESULTS = 1 # Not enough questions for the requested amount
+
+# Amount requested by the single fallback request when a category cannot supply the requested amount.
+# The API does not report how many true/false questions a category has, so this is a fixed guess
+# matching the smallest amount offered in the setup screen.
+FALLBACK_AMOUNT = 10
+
+# Backoff settings used when the API responds with 429 Too Many Requests
+BACKOFF_BASE = 0.25 # Initial delay in seconds
+BACKOFF_CAP = 8 # Maximum delay in seconds
+BACKOFF_JITTER = 0.25 # Maximum random jitter added to each delay
+MAX_RATE_LIMIT_ATTEMPTS = 5 # Give up after this many rate-limited attempts
+
+# In-memory cache of fetched question sets, keyed by (category_code, number_of_questions)
+_CACHE = {} # Maps key -> (timestamp, results)
+_CACHE_TTL = 300.0 # Seconds a cached question set stays valid
+_CACHE_MAX_ENTRIES = 32 # Maximum number of cached question sets
+
+# Fetches currently in progress, so concurrent identical requests share a single API call
+_INFLIGHT = {} # Maps key -> threading.Event set when the fetch for that key completes
+_INFLIGHT_LOCK = threading.Lock() # Guards _INFLIGHT and writes to _CACHE
+
+
+def _evict_if_needed():
+    """Drops the oldest cached question set when the cache grows past its size limit."""
+    if len(_CACHE) > _CACHE_MAX_ENTRIES:
+        oldest_key = min(_CACHE, key=lambda k: _CACHE[k][0])
+        del _CACHE[oldest_key]
+
+
+def _retry_delay(response, attempt):
+    """
+    Calculates how long to wait before retrying a rate-limited request.
+
+    :param response: The 429 response returned by the API.
+    :param attempt: The number of rate-limited attempts made so far.
+    :return: The delay in seconds, taken from the Retry-After header when it is a finite number
+             (clamped to between 0 and BACKOFF_CAP), otherwise an exponential backoff with random jitter.
+    """
+    retry_after = response.headers.get("Retry-After")
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = math.nan
+
+    if math.isfinite(delay):
+        return min(BACKOFF_CAP, max(0.0, delay)) # Never sleep a negative or excessive amount
+
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_JITTER)
+
 
 def fetch_question_data(number_of_questions, category_code):
+    """
+    Fetches quiz question data, serving recently fetched question sets from an in-memory cache.
+
+    :param number_of_questions: The number of questions to retrieve (must be an integer).
+    :param category_code: The category code for the quiz questions.
+    :return: A list of question data if successful, None if unsuccessful.
+
+    Results are cached for _CACHE_TTL seconds per (category_code, number_of_questions) pair,
+    so repeating the same quiz configuration does not hit the API again. Concurrent calls
+    for the same pair wait for a single in-flight request instead of each calling the API.
+    """
+    key = (int(category_code), int(number_of_questions))
+
+    # Return a copy of the cached question set if it is still fresh
+    cached = _CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+        return copy.copy(cached[1])
+
+    # Join an identical fetch already in progress, or register this call as the one doing it
+    with _INFLIGHT_LOCK:
+        # Check the cache again, in case a fetch for this key finished since the check above
+        cached = _CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+            return copy.copy(cached[1])
+
+        event = _INFLIGHT.get(key)
+        is_leader = event is None
+        if is_leader:
+            event = threading.Event()
+            _INFLIGHT[key] = event
+
+    if not is_leader:
+        # Wait for the in-flight fetch; its result (if successful) is in the cache
+        event.wait()
+        cached = _CACHE.get(key)
+        return copy.copy(cached[1]) if cached is not None else None
+
+    results = None
+    try:
+        results = _request_question_data(number_of_questions, category_code)
+    finally:
+        with _INFLIGHT_LOCK:
+            # Only cache successful fetches
+            if results is not None:
+                _CACHE[key] = (time.monotonic(), results)
+                _evict_if_needed()
+
+            # Allow new fetches for this key
+            del _INFLIGHT[key]
+
+        # Wake any callers waiting on this fetch
+        event.set()
+
+    return copy.copy(results) if results is not None else None
+
+
+def _request_question_data(number_of_questions, category_code):
     """
     Fetches quiz question data from the Open Trivia Database API.
 
@@ -25,19 +170,25 @@ def fetch_question_data(number_of_questions, category_code):
     :return: A list of question data if successful, None if unsuccessful.
 
     This function ensures that the number of questions is a positive integer and
-    handles potential HTTP errors and response validation. If the request fails due to
-    rate limiting, it waits before retrying. If no valid data is found after several
-    attempts, it returns None.
+    handles potential HTTP errors and response validation. If the category does not have
+    enough questions, it makes a single fallback request for FALLBACK_AMOUNT questions (or one
+    fewer than requested, if that is smaller). The returned list may therefore be shorter
+    than requested. If the request fails due to rate limiting, it waits with
+    exponential backoff (or the server's Retry-After value) before retrying. If no valid
+    data is found, the request fails or times out, or the response cannot be parsed,
+    it returns None.
     """
 
     # Ensure number_of_questions is an integer
     number_of_questions = int(number_of_questions)
 
-    # Start with a valid_param flag as False
-    valid_param = False
+    # Whether the single fallback request for fewer questions has been made
+    fallback_used = False
 
-    # Loop to retry fetching questions until valid data is obtained or number_of_questions reaches zero
-    while not valid_param and number_of_questions > 0:
+    # Count rate-limited attempts to drive the backoff and stop retrying eventually
+    attempt = 0
+
+    while number_of_questions > 0:
         parameters = {
             "amount": number_of_questions,
             "category": category_code,
@@ -46,29 +197,55 @@ def fetch_question_data(number_of_questions, category_code):
 
         try:
             # Make a GET request to the Open Trivia Database API with the specified parameters
-            response = requests.get(url="https://opentdb.com/api.php", params=parameters)
+            response = _SESSION.get(API_URL, params=parameters, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()  # Raises an error for HTTP error responses
 
             # Parse the JSON response data
-            response_data = response.json()
+            response_data = _loads(response.content)
+            response_code = response_data["response_code"]
 
             # Check if the response indicates a successful request
-            if response_data["response_code"] == 0: # Set flag to true since valid data is received
+            if response_code == RESPONSE_CODE_SUCCESS:
                 return response_data["results"] # Return the list of questions
-            else:
-                # Handle invalid request responses
-                print("Invalid request for amount:", number_of_questions)
-                print("Response Code:", response_data["response_code"])
-                number_of_questions -= 1 # Decrement the number of questions to retry
-                print("Trying with amount:", number_of_questions)
+
+            # Handle invalid request responses
+            print("Invalid request for amount:", number_of_questions)
+            print("Response Code:", response_code)
+
+            if response_code != RESPONSE_CODE_NO_RESULTS or fallback_used:
+                break  # Give up rather than retrying indefinitely
+
+            # Retry once with the fixed fallback amount
+            fallback_used = True
+            number_of_questions = min(number_of_questions - 1, FALLBACK_AMOUNT)
+            print("Trying with amount:", number_of_questions)
+
+        except requests.exceptions.Timeout:
+            # Fail fast rather than keep the UI waiting on a stalled connection
+            print("Request timed out.")
+            break
 
         except requests.exceptions.HTTPError as e:
             # Handle specific HTTP errors
             if response.status_code == 429:
+                if attempt >= MAX_RATE_LIMIT_ATTEMPTS:
+                    print("Too many requests. Giving up after", attempt, "attempts.")
+                    break  # Stop retrying if the API keeps rate limiting us
                 print("Too many requests. Waiting before retrying...")
-                time.sleep(2)  # Wait before retrying due to rate limits
+                time.sleep(_retry_delay(response, attempt))  # Wait before retrying due to rate limits
+                attempt += 1
             else:
                 print(f"Request failed: {e}") # Print the error message
                 break  # Exit on other request failures
 
-    return None  # Return None if no valid data was found after retries
\ No newline at end of file
+        except requests.exceptions.RequestException as e:
+            # Handle connection failures and other request errors
+            print(f"Request failed: {e}")
+            break
+
+        except (ValueError, KeyError) as e:
+            # Handle responses that are not valid JSON or lack the expected fields
+            print(f"Invalid response data: {e}")
+            break
+
+    return None  # Return None if no valid data was found
@@ -10,7 +10,7 @@ Description:
 
 Attributes:
 - text: The text of the question.
-- answer: The correct answer to the question.
+- answer: The correct answer to the question, stored in lowercase.
 
 Usage:
 1. Create an instance of Question with the question text and answer.
@@ -18,13 +18,14 @@ Usage:
 
 class Question:
 
+    __slots__ = ("text", "answer") # Fixed attributes, no per-instance __dict__
+
     def __init__(self, q_text, q_answer):
         """
         Initializes a Question instance with the given text and answer.
 
         :param q_text: The text of the question.
         :param q_answer: The correct answer to the question.
-        :param q_answer: The correct answer to the question.
         """
         self.text = q_text # Stores the question text
-        self.answer = q_answer # Stores the correct answer
+        self.answer = q_answer.lower() # Stores the correct answer, lowercased once for comparisons
@@ -17,34 +17,62 @@ Main Features:
 - Compares user answers against correct answers and updates the score accordingly.
 
 Usage:
-1. Create an instance of QuizBrain with a list of Question objects.
+1. Create an instance of QuizBrain with a list of Question objects, or with
+   QuizBrain.from_api_results using the question data fetched from the API.
 2. Use methods to manage the quiz flow and check answers.
 """
 
+import functools
 import html
+from question_model import Question
+
+# Memoized html.unescape, so strings repeated across questions are only parsed once
+_unescape = functools.lru_cache(maxsize=256)(html.unescape)
 
 class QuizBrain:
 
+    __slots__ = ("question_number", "score", "question_list", "current_question", "total_questions", "category")
+
     def __init__(self, q_list):
         """
         Initializes the QuizBrain instance with a list of questions.
 
         :param q_list: A list of Question objects containing quiz questions and answers.
+                       Their text and answers are unescaped in place.
         """
         self.question_number = 0 # Tracks the current question number the user is on
         self.score = 0 # Keeps track of the user's score
         self.question_list = q_list # Stores the list of questions
+
+        # Unescape HTML entities in every question up front so serving a question needs no extra work
+        for question in self.question_list:
+            question.text = _unescape(question.text)
+            question.answer = _unescape(question.answer)
         self.current_question = None # Holds the current question object
         self.total_questions = 0 # Total number of questions in the quiz
         self.category = "" # Default category placeholder
 
+    @classmethod
+    def from_api_results(cls, results, total_questions):
+        """
+        Creates a QuizBrain from question data returned by the Open Trivia Database API.
+
+        :param results: A non-empty list of question dictionaries as returned by the API.
+        :param total_questions: The total number of questions to be tracked.
+        :return: A QuizBrain with its questions, total and category set.
+        """
+        quiz = cls([Question(result["question"], result["correct_answer"]) for result in results])
+        quiz.set_total_number_of_questions(total_questions)
+        quiz.set_category(results[0]["category"]) # All questions share the requested category
+        return quiz
+
     def set_category(self, category):
         """
         Sets the category of the quiz using the provided category string.
 
         :param category: The category name as a string, which will be unescaped
         """
-        self.category = html.unescape(category) # Unescapes HTML entities in the category name
+        self.category = _unescape(category) # Unescapes HTML entities in the category name
 
     def set_total_number_of_questions(self, total_questions):
         """
@@ -70,8 +98,7 @@ class QuizBrain:
         """
         self.current_question = self.question_list[self.question_number] # Get the current question object
         self.question_number += 1 # Move to the next question
-        q_text = html.unescape(self.current_question.text) # Unescape HTML entities in the question text
-        return f"Q.{self.question_number}: {q_text}" # Return the formatted question
+        return f"Q.{self.question_number}: {self.current_question.text}" # Return the formatted question
 
     def check_answer(self, user_answer):
         """
@@ -82,8 +109,8 @@ class QuizBrain:
         """
         correct_answer = self.current_question.answer # Get the correct answer from the current question
 
-        # Compare the user's answer to the correct answer, ignoring case.
-        if user_answer.lower() == correct_answer.lower():
+        # Compare the user's answer to the correct answer (already lowercased), ignoring case.
+        if user_answer.lower() == correct_answer:
             self.score += 1  # Increment the score if the answer is correct
             return True
         else:
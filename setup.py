@@ -18,8 +18,7 @@ Dependencies:
 - Tkinter (Python standard GUI library)
 """
 
-from tkinter import *
-from tkinter import ttk, messagebox, Frame
+from tkinter import Toplevel, Label, Button, Frame, StringVar, IntVar, OptionMenu
 
 # UI Color Scheme and Fonts
 MAIN_COLOR = "#375362" # Primary background color
@@ -36,16 +35,36 @@ HIGHLIGHT_THICKNESS = 0 # Thickness of the highlight around focused elements (se
 
 class QuizSetup:
 
-    def __init__(self):
+    __slots__ = (
+        "category_code",
+        "number_of_questions",
+        "window",
+        "welcome_message_top",
+        "welcome_message_bottom",
+        "number_of_questions_label",
+        "selected_option",
+        "_num_buttons",
+        "_selected_num_btn",
+        "category_label",
+        "options_category",
+        "_category_code_map",
+        "value_category",
+        "button_proceed",
+    )
+
+    def __init__(self, root):
         """
         GUI class for setting up quiz parameters including difficulty, category,
-        and number of questions. Initializes and displays a main window with options.
+        and number of questions. Initializes and displays a setup window with options,
+        returning once the window has been closed.
+
+        :param root: The application's Tk root window, shared with the quiz interface.
         """
         self.category_code = 0  # Code corresponding to quiz category
         self.number_of_questions = 0 # Number of quiz questions selected by user
 
-        # Create the main application window
-        self.window = Tk()
+        # Create the setup window on top of the shared root window
+        self.window = Toplevel(root)
         self.window.title("QuizMe by Moa Burke") # Set window title
         self.window.config(padx=20, pady=30, bg=MAIN_COLOR) # Padding and background color
 
@@ -61,13 +80,14 @@ class QuizSetup:
         # Add a 'Proceed' button to confirm selected settings
         self.create_proceed_button()
 
-        # Run the Tkinter main loop to keep the window open
-        self.window.mainloop()
+        # Process events until the setup window is closed
+        self.window.wait_window()
 
     def create_welcome_message(self):
         """Creates and displays the main welcome messages at the top of the screen."""
         # Main title label
         self.welcome_message_top = Label(
+            self.window,
             text="QuizMe",
             width=12,
             bg=SECONDARY_COLOR,
@@ -78,6 +98,7 @@ class QuizSetup:
 
         # Subtitle with app description
         self.welcome_message_bottom = Label(
+            self.window,
             text="Challenge Your Knowledge Across Different Categories!",
             bg=MAIN_COLOR,
             fg=ACCENT_COLOR,
@@ -90,6 +111,7 @@ class QuizSetup:
         """Sets up options for selecting the number of questions."""
         # Label for the number of questions selection
         self.number_of_questions_label = Label(
+            self.window,
             text="Number of Questions:",
             bg=MAIN_COLOR,
             fg=SECONDARY_COLOR,
@@ -102,11 +124,14 @@ class QuizSetup:
         button_frame.pack(pady=5)  # Add vertical padding
 
         # Default selection value for the dropdown
-        self.selected_option = StringVar(self.window, "10")
+        self.selected_option = IntVar(self.window, 10)
 
         # Options for the number of questions
         options_number_of_questions = [10, 15, 20, 25, 30]
 
+        # Buttons keyed by the number of questions they select
+        self._num_buttons = {}
+
         # Create a custom button for each option
         for value in options_number_of_questions:
             button = Button(
@@ -116,21 +141,23 @@ class QuizSetup:
                 fg=MAIN_COLOR,
                 font=("Arial", 10, "bold"),
                 width=5,
-                command=lambda v=value: self.select_option(v, button_frame), # Passes value to selection method
+                command=lambda v=value: self.select_option(v), # Passes value to selection method
                 pady=8,
                 bd=0,
                 cursor=CURSOR_HAND  # Changes cursor to hand on hover
             )
             button.pack(side="left", padx=5)  # Pack horizontally with spacing
+            self._num_buttons[value] = button
 
-            # Highlight the default button for 10 questions
-            if value == 10:
-                button.config(bg=ACCENT_COLOR, fg=SECONDARY_COLOR)  # Set initial selected color
+        # Highlight the default button for 10 questions
+        self._selected_num_btn = self._num_buttons[10]
+        self._selected_num_btn.config(bg=ACCENT_COLOR, fg=SECONDARY_COLOR)  # Set initial selected color
 
     def create_category_selector(self):
         """Creates a dropdown menu to select quiz categories from predefined options."""
         # Create and display a label for category selection
         self.category_label = Label(
+            self.window,
             text="Category:",
             bg=MAIN_COLOR,
             fg=SECONDARY_COLOR,
@@ -150,6 +177,9 @@ class QuizSetup:
             {"category": "History", "code": 23},
         ]
 
+        # Map each category name to its code for direct lookup when settings are confirmed
+        self._category_code_map = {item["category"]: item["code"] for item in self.options_category}
+
         # Initialize a variable to store the selected category, defaulting to the first option
         self.value_category = StringVar(self.window)
         self.value_category.set(self.options_category[0]['category'])  # Set the default category to the first in the list
@@ -185,6 +215,7 @@ class QuizSetup:
         """Creates and configures the 'Proceed' button to confirm selections."""
         # Button for proceeding
         self.button_proceed = Button(
+            self.window,
             text="PROCEED",
             command=self.get_quiz_settings,
             bg=ACCENT_COLOR,
@@ -199,53 +230,38 @@ class QuizSetup:
         )
         self.button_proceed.pack(pady=30)
 
-    def select_option(self, value, button_frame):
+    def select_option(self, value):
         """
         Updates selected number of questions and adjusts button colors
         to indicate selected option.
 
         :param value: Number of questions selected by the user.
-        :param button_frame: Frame containing the question number buttons.
         """
         # Set the selected option to the user's choice
         self.selected_option.set(value)
 
-        # Iterate through all children of the button frame to update their colors
-        for btn in button_frame.winfo_children():
-            # Check if the child is a button
-            if isinstance(btn, Button):
-                # If the button's text matches the selected value, apply the selected color scheme
-                if btn.cget("text") == str(value):
-                    btn.config(bg=ACCENT_COLOR, fg=SECONDARY_COLOR)  # Highlight selected button
-                else:
-                    # Reset colors for buttons that are not selected
-                    btn.config(bg=SECONDARY_COLOR, fg=MAIN_COLOR) # Default color for unselected buttons
+        # Reset the previously selected button to the default colors
+        self._selected_num_btn.config(bg=SECONDARY_COLOR, fg=MAIN_COLOR)
+
+        # Highlight the newly selected button
+        self._selected_num_btn = self._num_buttons[value]
+        self._selected_num_btn.config(bg=ACCENT_COLOR, fg=SECONDARY_COLOR)
 
     def get_quiz_settings(self):
         """
         Retrieves and stores the selected quiz settings (category and question count).
         This method is triggered when the 'Proceed' button is clicked.
         """
-        # Get the name of the selected category from the dropdown
-        category = self.value_category.get()
-
-        # Match the selected category name to its corresponding code in options_category
-        category_code = None
-        for value in self.options_category:
-            if value["category"] == category:
-                category_code = value["code"] # Retrieve category code when found
-                break
-
-        # Store the category code in the instance variable
-        self.category_code = category_code
+        # Look up the code of the category selected in the dropdown and store it
+        self.category_code = self._category_code_map[self.value_category.get()]
 
-        # Convert selected question count to an integer and store it
-        self.number_of_questions = int(self.selected_option.get())
+        # Store the selected question count
+        self.number_of_questions = self.selected_option.get()
 
         # Close the setup window after settings are successfully retrieved
         self.exit_settings()
 
     def exit_settings(self):
-        """Destroys the main window to end the setup process."""
+        """Destroys the setup window to end the setup process."""
         self.window.destroy()
 
@@ -12,10 +12,11 @@ Key Components:
 - Event handling: Responds to user input (true/false answers) and updates the GUI accordingly.
 
 Usage:
-Instantiate the QuizInterface class with a QuizBrain object to start the quiz interface.
+Instantiate the QuizInterface class with a QuizBrain object and the Tk root window, then run the root's
+main loop to start the quiz interface.
 """
 
-from tkinter import *
+from tkinter import Toplevel, Label, Button, Canvas
 from quiz_brain import QuizBrain
 
 # UI Color Scheme and Fonts
@@ -26,28 +27,64 @@ CORRECT_ANSWER_COLOR = "#d0dbc5"  # Light green for correct answers
 INCORRECT_ANSWER_COLOR = "#dbafb8"  # Light red for incorrect answers
 FONT_NAME = "Bahnschrift SemiLight Condensed" # Font for application text
 
+# Label text formatters
+SCORE_TEXT = "Score: {}".format # Score label, formatted with the current score
+QUESTION_NUMBER_TEXT = "Question {}/{}".format # Question number label, formatted with the number and total
+
 class QuizInterface:
 
-    def __init__(self, quiz_brain: QuizBrain):
+    __slots__ = (
+        "quiz",
+        "window",
+        "question_number_label",
+        "score_label",
+        "category_label",
+        "canvas",
+        "_bg_rect",
+        "question_text",
+        "button_true",
+        "button_false",
+        "_next_question_text",
+        "_next_question_number",
+        "_last_score",
+        "_last_qnum_text",
+    )
+
+    def __init__(self, quiz_brain: QuizBrain, root):
+        """
+        Builds the quiz window on top of the shared root window and shows the first question.
+
+        :param quiz_brain: The QuizBrain managing the quiz questions and score.
+        :param root: The application's Tk root window; it is destroyed when the quiz window is closed.
+        """
         self.quiz = quiz_brain
-        self.window = Tk()
+        self._next_question_text = None # Next question text prepared during the feedback delay
+        self._next_question_number = 0 # Number of the prefetched question
+        self._last_score = 0 # Score currently shown on the score label
+        self._last_qnum_text = "" # Text currently shown on the question number label
+        self.window = Toplevel(root)
         self.window.title("QuizMe by Moa Burke") # Title of the window
+        self.window.protocol("WM_DELETE_WINDOW", root.destroy) # Closing the quiz ends the application
         self.window.config(width=400, height=600, padx=20, pady=20, bg=MAIN_COLOR)
 
         # Label to display the question number
-        self.question_number_label = Label(bg=MAIN_COLOR, fg=SECONDARY_COLOR, font=(FONT_NAME, 14), pady=15)
+        self.question_number_label = Label(self.window, bg=MAIN_COLOR, fg=SECONDARY_COLOR, font=(FONT_NAME, 14), pady=15)
         self.question_number_label.grid(row=0, column=0)
 
         # Label to display the user's score
-        self.score_label = Label(text="Score: 0", bg=MAIN_COLOR, fg=SECONDARY_COLOR, font=(FONT_NAME, 14), pady=15)
+        self.score_label = Label(self.window, text=SCORE_TEXT(self._last_score), bg=MAIN_COLOR, fg=SECONDARY_COLOR, font=(FONT_NAME, 14), pady=15)
         self.score_label.grid(row=0, column=1)
 
         # Label to display the current category of questions
-        self.category_label = Label(text=self.quiz.category, bg=MAIN_COLOR, fg=ACCENT_COLOR, font=(FONT_NAME, 18))
+        self.category_label = Label(self.window, text=self.quiz.category, bg=MAIN_COLOR, fg=ACCENT_COLOR, font=(FONT_NAME, 18))
         self.category_label.grid(row=1, column=0, columnspan=2)
 
         # Create canvas to display the card
-        self.canvas = Canvas(width=300, height = 250, highlightthickness=0, bg=SECONDARY_COLOR)
+        self.canvas = Canvas(self.window, width=300, height = 250, highlightthickness=0, bg=SECONDARY_COLOR)
+
+        # Background rectangle covering the card, recolored to show feedback
+        # (created before the question text so the text is drawn above it)
+        self._bg_rect = self.canvas.create_rectangle(0, 0, 300, 250, fill=SECONDARY_COLOR, outline="")
 
         # Create text element on the canvas for the question text
         self.question_text = self.canvas.create_text(
@@ -59,8 +96,20 @@ class QuizInterface:
             fill=MAIN_COLOR)
         self.canvas.grid(row=2, column=0, columnspan=2, pady=15)
 
+        # Let the labels and canvas paint before building the answer buttons
+        self.window.update_idletasks()
+
+        # Buttons for the user to answer "True" or "False"
+        self.create_answer_buttons()
+
+        # Load the first question at startup
+        self.get_next_question()
+
+    def create_answer_buttons(self):
+        """Creates the "True" and "False" buttons used to answer questions."""
         # Button for user to answer "True"
         self.button_true = Button(
+            self.window,
             text="TRUE",
             command= self.true_pressed,
             bg=ACCENT_COLOR,
@@ -77,6 +126,7 @@ class QuizInterface:
 
         # Button for user to answer "False"
         self.button_false = Button(
+            self.window,
             text="FALSE",
             command=self.false_pressed,
             bg=ACCENT_COLOR,
@@ -91,13 +141,6 @@ class QuizInterface:
         )
         self.button_false.grid(row=4, column=0, columnspan=2, pady=(0, 20))
 
-        # Load the first question at startup
-        self.get_next_question()
-
-        # Start the Tkinter event loop to listen for user interactions
-        self.window.mainloop()
-
-
     def get_next_question(self):
         """
         Retrieves the next question from the quiz and updates the GUI elements accordingly.
@@ -106,26 +149,52 @@ class QuizInterface:
         and configures the question number label. It retrieves the next question and displays it
         on the canvas. If there are no more questions, it shows the final score and disables the answer buttons.
         """
-        self.canvas.config(bg=SECONDARY_COLOR)  # Reset canvas background color
-        self.score_label.config(text=f"Score: {self.quiz.score}") # Update score label
-
+        self.canvas.itemconfig(self._bg_rect, fill=SECONDARY_COLOR)  # Reset card background color
+
+        # Update the score label only when the score has changed
+        if self.quiz.score != self._last_score:
+            self._last_score = self.quiz.score
+            self.score_label.config(text=SCORE_TEXT(self._last_score))
+
+        # Use the question prepared during the feedback delay, if any
+        if self._next_question_text is not None:
+            self.update_question_number_label(self._next_question_number)
+            self.canvas.itemconfig(self.question_text, text=self._next_question_text)
+            self._next_question_text = None
+            self.enable_answer_buttons()
         # Check if there are more questions available
-        if self.quiz.still_has_questions():
-            # Update the question number label to show current question and total questions\
-            self.question_number_label.config(
-                text=f"Question {self.quiz.question_number + 1}/{self.quiz.total_questions}")
+        elif self.quiz.still_has_questions():
+            # Update the question number label to show current question and total questions
+            self.update_question_number_label(self.quiz.question_number + 1)
 
             # Get the next question text from the quiz brain
             q_text = self.quiz.next_question()
 
             # Update the canvas to show the new question
             self.canvas.itemconfig(self.question_text, text=q_text)
+            self.enable_answer_buttons()
         else:
             # No more questions: Display the final score and disable answer buttons
             self.canvas.itemconfig(self.question_text, text=f"Total Score: {self.quiz.score}/{self.quiz.question_number}", font=(FONT_NAME, 25, "bold"))
             self.button_true.config(state="disabled")  # Disable the True button
-            self.button_false.config(state="disabled") # Disable the True button
+            self.button_false.config(state="disabled") # Disable the False button
+
+    def enable_answer_buttons(self):
+        """Re-enables the answer buttons once a new question is displayed."""
+        self.button_true.config(state="normal")
+        self.button_false.config(state="normal")
+
+    def update_question_number_label(self, question_number):
+        """
+        Shows the given question number and the total number of questions on the question number label,
+        skipping the update if the label already shows that text.
 
+        :param question_number: The number of the question being displayed.
+        """
+        qnum_text = QUESTION_NUMBER_TEXT(question_number, self.quiz.total_questions)
+        if qnum_text != self._last_qnum_text:
+            self._last_qnum_text = qnum_text
+            self.question_number_label.config(text=qnum_text)
 
     def true_pressed(self):
         """
@@ -156,15 +225,32 @@ class QuizInterface:
         Provides visual feedback to the user based on whether their answer was correct or incorrect.
 
         This method changes the background color of the canvas to indicate if the answer was right (green)
-        or wrong (red). It also schedules the next question to be displayed after a brief pause.
+        or wrong (red). It also schedules the next question to be displayed after a brief pause, disabling
+        the answer buttons until then so no answer is graded against the prefetched question.
 
         :param is_right: A boolean indicating whether the user's answer was correct (True) or incorrect (False).
         """
         if is_right:
-            self.canvas.config(bg=CORRECT_ANSWER_COLOR) # Set background to light green for correct answer
+            self.canvas.itemconfig(self._bg_rect, fill=CORRECT_ANSWER_COLOR) # Set background to light green for correct answer
         else:
-            self.canvas.config(bg=INCORRECT_ANSWER_COLOR) # Set background to light red for incorrect answer
+            self.canvas.itemconfig(self._bg_rect, fill=INCORRECT_ANSWER_COLOR) # Set background to light red for incorrect answer
+
+        # Disable answering until the next question is shown, since the quiz advances to it early
+        self.button_true.config(state="disabled")
+        self.button_false.config(state="disabled")
+
+        # Prepare the next question while the feedback is showing
+        self.window.after(50, self._prefetch_next)
 
         # Wait 1 second before loading the next question
         self.window.after(1000, self.get_next_question)
 
+    def _prefetch_next(self):
+        """
+        Advances the quiz to the next question and stores its text for get_next_question,
+        so the update after the feedback delay only has to refresh the GUI.
+        """
+        if self._next_question_text is None and self.quiz.still_has_questions():
+            self._next_question_number = self.quiz.question_number + 1
+            self._next_question_text = self.quiz.next_question()
+